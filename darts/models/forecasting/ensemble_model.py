@@ -3,7 +3,6 @@ Ensemble Model Base Class
 """
 
 from abc import abstractmethod
-from functools import reduce
 from typing import List, Optional, Sequence, Tuple, Union
 
 from darts.logging import get_logger, raise_if, raise_if_not, raise_log
@@ -12,7 +11,7 @@ from darts.models.forecasting.forecasting_model import (
     GlobalForecastingModel,
     LocalForecastingModel,
 )
-from darts.timeseries import TimeSeries
+from darts.timeseries import TimeSeries, concatenate
 from darts.utils.utils import series2seq
 
 logger = get_logger(__name__)
@@ -196,8 +195,9 @@ class EnsembleModel(GlobalForecastingModel):
         return self
 
     def _stack_ts_seq(self, predictions):
-        # stacks list of predictions into one multivariate timeseries
-        return reduce(lambda a, b: a.stack(b), predictions)
+        # stacks list of predictions into one multivariate timeseries, in a single concatenation
+        # (rather than pairwise) so that the values of all models end up in one contiguous array
+        return concatenate(predictions, axis=1)
 
     def _stack_ts_multiseq(self, predictions_list):
         # stacks multiple sequences of timeseries elementwise
@@ -12,7 +12,6 @@ from darts.models.forecasting.forecasting_model import ForecastingModel
 from darts.models.forecasting.linear_regression_model import LinearRegressionModel
 from darts.models.forecasting.regression_model import RegressionModel
 from darts.timeseries import TimeSeries
-from darts.utils.utils import seq2series, series2seq
 
 logger = get_logger(__name__)
 
@@ -105,8 +104,11 @@ class RegressionEnsembleModel(EnsembleModel):
     def _split_multi_ts_sequence(
         self, n: int, ts_sequence: Sequence[TimeSeries]
     ) -> Tuple[Sequence[TimeSeries], Sequence[TimeSeries]]:
-        left = [ts[:-n] for ts in ts_sequence]
-        right = [ts[-n:] for ts in ts_sequence]
+        # split each series in a single pass over the sequence
+        left, right = [], []
+        for ts in ts_sequence:
+            left.append(ts[:-n])
+            right.append(ts[-n:])
         return left, right
 
     def fit(
@@ -124,9 +126,7 @@ class RegressionEnsembleModel(EnsembleModel):
         if is_single_series:
             train_n_points_too_big = len(self.training_series) <= self.train_n_points
         else:
-            train_n_points_too_big = any(
-                [len(s) <= self.train_n_points for s in series]
-            )
+            train_n_points_too_big = any(len(s) <= self.train_n_points for s in series)
 
         raise_if(
             train_n_points_too_big,
@@ -171,15 +171,17 @@ class RegressionEnsembleModel(EnsembleModel):
         # prepare the forecasting models for further predicting by fitting them with the entire data
 
         # Some models (incl. Neural-Network based models) may need to be 'reset' to allow being retrained from scratch
-        self.models = [model.untrained_model() for model in self.models]
-
+        retrained_models = []
         for model in self.models:
+            model = model.untrained_model()
             kwargs = dict(series=series)
             if model.supports_past_covariates:
                 kwargs["past_covariates"] = past_covariates
             if model.supports_future_covariates:
                 kwargs["future_covariates"] = future_covariates
             model.fit(**kwargs)
+            retrained_models.append(model)
+        self.models = retrained_models
         return self
 
     def ensemble(
@@ -189,21 +191,20 @@ class RegressionEnsembleModel(EnsembleModel):
         num_samples: int = 1,
         predict_likelihood_parameters: bool = False,
     ) -> Union[TimeSeries, Sequence[TimeSeries]]:
-        is_single_series = isinstance(series, TimeSeries) or series is None
-        predictions = series2seq(predictions)
-        series = series2seq(series) if series is not None else [None]
-
-        ensembled = [
-            self.regression_model.predict(
-                n=len(prediction),
-                series=serie,
-                future_covariates=prediction,
-                num_samples=num_samples,
-                predict_likelihood_parameters=predict_likelihood_parameters,
-            )
-            for serie, prediction in zip(series, predictions)
-        ]
-        return seq2series(ensembled) if is_single_series else ensembled
+        # all the predictions share the same horizon, they are ensembled with a single call to the
+        # regression model which builds one feature matrix for all the series
+        n = (
+            len(predictions)
+            if isinstance(predictions, TimeSeries)
+            else len(predictions[0])
+        )
+        return self.regression_model.predict(
+            n=n,
+            series=series,
+            future_covariates=predictions,
+            num_samples=num_samples,
+            predict_likelihood_parameters=predict_likelihood_parameters,
+        )
 
     @property
     def extreme_lags(
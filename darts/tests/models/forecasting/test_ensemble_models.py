@@ -141,6 +141,21 @@ class TestEnsembleModels:
         )
         assert all(forecast_naive_ensemble.components == multivariate_series.components)
 
+    def test_stack_multiple_predictions(self):
+        multivariate_series = self.series1.stack(self.series2)
+        models = [NaiveSeasonal(K=1), NaiveSeasonal(K=5), NaiveSeasonal(K=8)]
+        naive_ensemble = NaiveEnsembleModel(models)
+        naive_ensemble.fit(multivariate_series)
+        preds = naive_ensemble._make_multiple_predictions(n=5)
+
+        # the predictions of each model are stacked one after the other, in the order of the models
+        assert preds.n_components == len(models) * multivariate_series.n_components
+        assert len(set(preds.components)) == preds.n_components
+        for idx, model in enumerate(models):
+            np.testing.assert_array_equal(
+                preds.values()[:, 2 * idx : 2 * (idx + 1)], model.predict(5).values()
+            )
+
     def test_stochastic_naive_ensemble(self):
         num_samples = 100
 
@@ -268,6 +268,18 @@ class TestRegressionEnsembleModels:
         )
         assert isinstance(preds, list) and len(preds) == 1
 
+    def test_predict_multiple_series_as_single_series(self):
+        # ensembling multiple series at once must give the same forecasts as ensembling them one by one
+        series = [self.combined, self.sine_series]
+        ensemble_model = self.get_global_ensembe_model()
+        ensemble_model.fit(series, past_covariates=series)
+
+        preds = ensemble_model.predict(n=5, series=series, past_covariates=series)
+        for pred, ts in zip(preds, series):
+            pred_single = ensemble_model.predict(n=5, series=ts, past_covariates=ts)
+            assert pred.time_index.equals(pred_single.time_index)
+            np.testing.assert_array_almost_equal(pred.values(), pred_single.values())
+
     def helper_test_models_accuracy(
         self, model_instance, n, series, past_covariates, min_rmse
     ):